@@ -3,6 +3,7 @@ import threading
 from json import JSONDecodeError
 
 import requests
+from cachetools import TTLCache
 from requests.exceptions import RequestException
 
 from prism.ratelimiting import RateLimiter
@@ -29,6 +30,9 @@ burst_limiter = RateLimiter(limit=BURST_REQUEST_LIMIT, window=BURST_REQUEST_WIND
 # TTL on this cache can be large because for a username to get a new uuid the user
 # must first change their ign, then, after 37 days, someone else can get the name
 LOWERCASE_UUID_CACHE: dict[str, str] = {}  # Mapping username.lower() -> uuid
+# Usernames without an account are usually nicks, which we see again and again while
+# they stay in the lobby. Names can be claimed, so only remember these for a while.
+LOWERCASE_MISSING_UUID_CACHE: TTLCache[str, bool] = TTLCache(maxsize=512, ttl=5 * 60)
 UUID_MUTEX = threading.Lock()
 
 
@@ -55,16 +59,34 @@ def _make_request(
     return response
 
 
-def get_uuid(
-    username: str, retry_limit: int = 3, timeout: float = 5
-) -> str | None:  # pragma: nocover
+def get_uuid(username: str, retry_limit: int = 3, timeout: float = 5) -> str | None:
     """Get the uuid of the user. None if not found."""
     with UUID_MUTEX:
         cache_hit = LOWERCASE_UUID_CACHE.get(username.lower(), None)
+        known_missing = username.lower() in LOWERCASE_MISSING_UUID_CACHE
 
     if cache_hit is not None:
         return cache_hit
 
+    if known_missing:
+        return None
+
+    uuid = _request_uuid(username, retry_limit=retry_limit, timeout=timeout)
+
+    # Set cache
+    with UUID_MUTEX:
+        if uuid is None:
+            LOWERCASE_MISSING_UUID_CACHE[username.lower()] = True
+        else:
+            LOWERCASE_UUID_CACHE[username.lower()] = uuid
+
+    return uuid
+
+
+def _request_uuid(
+    username: str, *, retry_limit: int, timeout: float
+) -> str | None:  # pragma: nocover
+    """Request the uuid of the user from the Mojang API. None if not found."""
     try:
         response = execute_with_retry(
             functools.partial(_make_request, username=username),
@@ -100,8 +122,4 @@ def get_uuid(
             f"Request to Mojang API returned wrong type for uuid {uuid=}"
         )
 
-    # Set cache
-    with UUID_MUTEX:
-        LOWERCASE_UUID_CACHE[username.lower()] = uuid
-
     return uuid
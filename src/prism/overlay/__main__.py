@@ -70,7 +70,9 @@ def process_loglines_to_stdout(
     get_stat_list = prepare_overlay(controller, loglines=loglines)
 
     while True:
-        time.sleep(0.1)
+        # Wake up immediately on state updates. Completed stats downloads don't set
+        # the redraw event, so we still check for those every 0.1 seconds.
+        controller.redraw_event.wait(timeout=0.1)
 
         sorted_stats = get_stat_list()
 
@@ -145,7 +147,8 @@ def watch_from_logfile(
     with logpath.open("r", encoding="utf8", errors="replace") as logfile:
         # Process the entire logfile to get current player as well as potential
         # current party/lobby
-        fast_forward_state(controller, logfile.readlines())
+        # NOTE: Iterate the file lazily so we don't hold the entire log in memory
+        fast_forward_state(controller, logfile)
         final_position = logfile.tell()
 
     loglines = watch_file_with_reopen(logpath, start_at=final_position, blocking=True)
@@ -1,6 +1,6 @@
-import functools
+import itertools
 import logging
-import queue
+from collections import deque
 
 from prism.mojang import compare_uuids
 from prism.overlay.controller import ERROR_DURING_PROCESSING, OverlayController
@@ -59,14 +59,15 @@ def set_nickname(
 
         controller.store_settings()
 
-    with controller.nick_database.mutex:
-        # Delete your old nick if found
-        if old_nick is not None:
-            controller.nick_database.default_database.pop(old_nick, None)
-
-        if uuid is not None and uuid is not ERROR_DURING_PROCESSING:
-            # Add your new nick
-            controller.nick_database.default_database[nick] = uuid
+    # Delete your old nick if found, and add your new nick
+    controller.nick_database.update_default_database(
+        removed=(old_nick,) if old_nick is not None else (),
+        added=(
+            {nick: uuid}
+            if uuid is not None and uuid is not ERROR_DURING_PROCESSING
+            else {}
+        ),
+    )
 
     if old_nick is not None and old_nick != nick:
         # Drop the stats cache for your old nick
@@ -79,25 +80,29 @@ def set_nickname(
 
 
 def should_redraw(
-    controller: OverlayController, completed_stats_queue: queue.Queue[str]
+    controller: OverlayController, completed_stats_queue: deque[str]
 ) -> bool:
     """Check if any updates happened since last time that needs a redraw"""
     # Check if the state update thread has issued any redraws since last time
     redraw = controller.redraw_event.is_set()
 
-    # Check if any of the stats downloaded since last render are still in the lobby
-    while True:
-        try:
-            username = completed_stats_queue.get_nowait()
-        except queue.Empty:
-            break
-        else:
-            completed_stats_queue.task_done()
-            if not redraw:
-                if username in controller.state.lobby_players:
-                    # We just received the stats of a player in the lobby
-                    # Redraw the screen in case the stats weren't there last time
-                    redraw = True
+    if redraw:
+        # We are redrawing anyway -> discard the stats downloaded since last render
+        # NOTE: The stats are cached before being added to the queue, so the redraw
+        #       will include the stats of every username we discard here
+        completed_stats_queue.clear()
+    else:
+        # Drain the stats downloaded since last render
+        # NOTE: This is the only consumer, so the queue can't be emptied under our feet
+        completed_usernames: list[str] = []
+        while completed_stats_queue:
+            completed_usernames.append(completed_stats_queue.popleft())
+
+        # Check if any of the stats downloaded since last render are still in the lobby
+        if not controller.state.lobby_players.isdisjoint(completed_usernames):
+            # We just received the stats of a player in the lobby
+            # Redraw the screen in case the stats weren't there last time
+            redraw = True
 
     if redraw:
         # We are going to redraw - clear any redraw request
@@ -107,14 +112,14 @@ def should_redraw(
 
 
 def get_stats_and_winstreak(
-    username: str, completed_queue: queue.Queue[str], controller: OverlayController
+    username: str, completed_queue: deque[str], controller: OverlayController
 ) -> None:
     """Get a username from the requests queue and cache their stats"""
     # get_bedwars_stats sets the stats cache which will be read from later
     player = get_bedwars_stats(username, controller)
 
     # Tell the main thread that we downloaded this user's stats
-    completed_queue.put(username)
+    completed_queue.append(username)
 
     logger.debug(f"Finished gettings stats for {username}")
 
@@ -127,18 +132,17 @@ def get_stats_and_winstreak(
         if estimated_winstreaks is MISSING_WINSTREAKS:
             logger.debug(f"Updating missing winstreak for {username} failed")
         else:
-            for alias in player.aliases:
-                controller.player_cache.update_cached_player(
-                    alias,
-                    functools.partial(
-                        KnownPlayer.update_winstreaks,
-                        **estimated_winstreaks,
-                        winstreaks_accurate=winstreaks_accurate,
-                    ),
+
+            def update_winstreaks(cached_player: KnownPlayer) -> KnownPlayer:
+                return cached_player.update_winstreaks(
+                    **estimated_winstreaks, winstreaks_accurate=winstreaks_accurate
                 )
 
+            for alias in player.aliases:
+                controller.player_cache.update_cached_player(alias, update_winstreaks)
+
             # Tell the main thread that we got the estimated winstreak
-            completed_queue.put(username)
+            completed_queue.append(username)
             logger.debug(f"Updated missing winstreak for {username}")
 
 
@@ -148,6 +152,11 @@ def update_settings(new_settings: SettingsDict, controller: OverlayController) -
 
     Caller must acquire lock on settings
     """
+    if new_settings == controller.settings.to_dict():
+        # Nothing changed -> no need to write to disk or to redraw
+        logger.debug("Settings unchanged, skipping update")
+        return
+
     logger.debug(f"Updating settings with {new_settings}")
 
     antisniper_api_key_changed = (
@@ -164,21 +173,21 @@ def update_settings(new_settings: SettingsDict, controller: OverlayController) -
     )
 
     # Known_nicks
+    new_known_nicks = new_settings["known_nicks"]
+    old_known_nicks = controller.settings.known_nicks
+
     def uuid_changed(nickname: str) -> bool:
         """True if the uuid of the given nickname changed in new_settings"""
-        return (
-            new_settings["known_nicks"][nickname]
-            != controller.settings.known_nicks[nickname]
-        )
+        return new_known_nicks[nickname] != old_known_nicks[nickname]
 
-    new_nicknames = set(new_settings["known_nicks"].keys())
-    old_nicknames = set(controller.settings.known_nicks.keys())
+    new_nicknames = set(new_known_nicks.keys())
+    old_nicknames = set(old_known_nicks.keys())
 
     added_nicknames = new_nicknames - old_nicknames
     removed_nicknames = old_nicknames - new_nicknames
-    updated_nicknames = set(
-        filter(uuid_changed, set.intersection(new_nicknames, old_nicknames))
-    )
+    updated_nicknames = {
+        nickname for nickname in new_nicknames & old_nicknames if uuid_changed(nickname)
+    }
 
     # Update the API key
     if antisniper_api_key_changed:
@@ -192,8 +201,8 @@ def update_settings(new_settings: SettingsDict, controller: OverlayController) -
         controller.player_cache.clear_cache()
     else:
         # Refetch stats for nicknames that had a player assigned or unassigned
-        # for nickname in added_nicknames + removed_nicknames:
-        for nickname in set.union(added_nicknames, removed_nicknames):
+        # NOTE: added_nicknames and removed_nicknames are disjoint
+        for nickname in itertools.chain(added_nicknames, removed_nicknames):
             controller.player_cache.uncache_player(nickname)
 
         # Refetch stats for nicknames that were assigned to a different player
@@ -204,14 +213,14 @@ def update_settings(new_settings: SettingsDict, controller: OverlayController) -
     # NOTE: Since the caller must acquire the settings lock, we have two locks here
     # Make sure that we always acquire the settings lock before the nick database lock
     # to avoid deadlocks
-    with controller.nick_database.mutex:
-        for nickname in removed_nicknames:
-            controller.nick_database.default_database.pop(nickname, None)
-
-        for nickname in set.union(added_nicknames, updated_nicknames):
-            controller.nick_database.default_database[nickname] = new_settings[
-                "known_nicks"
-            ][nickname]["uuid"]
+    controller.nick_database.update_default_database(
+        removed=removed_nicknames,
+        added={
+            nickname: new_known_nicks[nickname]["uuid"]
+            # NOTE: added_nicknames and updated_nicknames are disjoint
+            for nickname in itertools.chain(added_nicknames, updated_nicknames)
+        },
+    )
 
     discord_presence_settings_changed = (
         new_settings["discord_rich_presence"]
@@ -1,12 +1,13 @@
 from dataclasses import dataclass
-from enum import Enum, auto, unique
+from enum import Enum, IntEnum, auto, unique
 from typing import Literal, Union
 
 PartyRole = Literal["leader", "moderators", "members"]
 
 
+# NOTE: IntEnum so that hashing (for the event processor lookup) is done by int
 @unique
-class EventType(Enum):
+class EventType(IntEnum):
     # Initialization
     INITIALIZE_AS = auto()  # Initialize as the given username
 
@@ -43,24 +44,24 @@ class EventType(Enum):
     WHISPER_COMMAND_SET_NICK = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InitializeAsEvent:
     username: str
     event_type: Literal[EventType.INITIALIZE_AS] = EventType.INITIALIZE_AS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NewNicknameEvent:
     nick: str
     event_type: Literal[EventType.NEW_NICKNAME] = EventType.NEW_NICKNAME
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LobbySwapEvent:
     event_type: Literal[EventType.LOBBY_SWAP] = EventType.LOBBY_SWAP
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LobbyJoinEvent:
     username: str
     player_count: int
@@ -68,54 +69,54 @@ class LobbyJoinEvent:
     event_type: Literal[EventType.LOBBY_JOIN] = EventType.LOBBY_JOIN
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LobbyLeaveEvent:
     username: str
     event_type: Literal[EventType.LOBBY_LEAVE] = EventType.LOBBY_LEAVE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LobbyListEvent:
-    usernames: list[str]
+    usernames: tuple[str, ...]
     event_type: Literal[EventType.LOBBY_LIST] = EventType.LOBBY_LIST
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyAttachEvent:
     username: str  # Leader
     event_type: Literal[EventType.PARTY_ATTACH] = EventType.PARTY_ATTACH
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyDetachEvent:
     event_type: Literal[EventType.PARTY_DETACH] = EventType.PARTY_DETACH
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyJoinEvent:
-    usernames: list[str]
+    usernames: tuple[str, ...]
     event_type: Literal[EventType.PARTY_JOIN] = EventType.PARTY_JOIN
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyLeaveEvent:
-    usernames: list[str]
+    usernames: tuple[str, ...]
     event_type: Literal[EventType.PARTY_LEAVE] = EventType.PARTY_LEAVE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyListIncomingEvent:
     event_type: Literal[EventType.PARTY_LIST_INCOMING] = EventType.PARTY_LIST_INCOMING
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PartyMembershipListEvent:
-    usernames: list[str]
+    usernames: tuple[str, ...]
     role: PartyRole  # The users' roles
     event_type: Literal[EventType.PARTY_ROLE_LIST] = EventType.PARTY_ROLE_LIST
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedwarsGameStartingSoonEvent:
     seconds: int
     event_type: Literal[
@@ -123,31 +124,31 @@ class BedwarsGameStartingSoonEvent:
     ] = EventType.BEDWARS_GAME_STARTING_SOON
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StartBedwarsGameEvent:
     event_type: Literal[EventType.START_BEDWARS_GAME] = EventType.START_BEDWARS_GAME
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedwarsFinalKillEvent:
     dead_player: str
     raw_message: str
     event_type: Literal[EventType.BEDWARS_FINAL_KILL] = EventType.BEDWARS_FINAL_KILL
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedwarsDisconnectEvent:
     username: str
     event_type: Literal[EventType.BEDWARS_DISCONNECT] = EventType.BEDWARS_DISCONNECT
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BedwarsReconnectEvent:
     username: str
     event_type: Literal[EventType.BEDWARS_RECONNECT] = EventType.BEDWARS_RECONNECT
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EndBedwarsGameEvent:
     event_type: Literal[EventType.END_BEDWARS_GAME] = EventType.END_BEDWARS_GAME
 
@@ -157,7 +158,7 @@ class WhisperCommandType(Enum):
     SET_NICK = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WhisperCommandSetNickEvent:
     nick: str
     username: str | None
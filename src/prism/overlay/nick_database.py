@@ -1,5 +1,6 @@
 import json
 import threading
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Self
@@ -25,9 +26,10 @@ def read_databases(database_paths: list[Path]) -> list[dict[str, str]]:
             raise DatabaseDecodeError(f"Can only decode json, not '{path.suffix}'")
 
         try:
-            with path.open("r") as f:
+            # Read the raw bytes and let json detect the encoding
+            with path.open("rb") as f:
                 try:
-                    database = json.load(f)
+                    database = json.loads(f.read())
                 except json.JSONDecodeError as e:
                     raise DatabaseDecodeError(
                         f"Failed to parse database at {path=}"
@@ -38,9 +40,7 @@ def read_databases(database_paths: list[Path]) -> list[dict[str, str]]:
         if not isinstance(database, dict):
             raise InvalidDatabaseError("Nick database must be a mapping")
 
-        if not all(isinstance(key, str) for key in database.keys()):  # pragma: no cover
-            raise InvalidDatabaseError("All database keys must be strings")
-
+        # NOTE: Keys of JSON objects are always strings, so we only check the values
         if not all(isinstance(value, str) for value in database.values()):
             raise InvalidDatabaseError("All database values must be strings")
 
@@ -49,20 +49,37 @@ def read_databases(database_paths: list[Path]) -> list[dict[str, str]]:
     return databases
 
 
+def merge_databases(databases: Sequence[Mapping[str, str]]) -> dict[str, str]:
+    """Merge the databases into one, giving precedence to the earlier databases"""
+    merged_database: dict[str, str] = {}
+    for database in reversed(databases):
+        merged_database.update(database)
+
+    return merged_database
+
+
 @dataclass
 class NickDatabase:
-    """Class for storing multiple mappings of nick -> uuid"""
+    """
+    Class for storing multiple mappings of nick -> uuid
+
+    The databases are never mutated once published. Writers acquire the lock and
+    publish an updated copy, so readers don't need to acquire the lock.
+    """
 
     default_database: dict[str, str] = field(init=False)  # The first database
     databases: list[dict[str, str]]
+    # All the databases merged into one so lookups only need to probe one dict
+    merged_database: dict[str, str] = field(init=False, compare=False, repr=False)
     mutex: threading.Lock = field(
         default_factory=threading.Lock, init=False, compare=False, repr=False
     )
 
     def __post_init__(self) -> None:
-        """Set the .default_database field"""
+        """Set the .default_database and .merged_database fields"""
         assert len(self.databases) > 0, "Must provide at least 1 database"
         self.default_database = self.databases[0]
+        self.merged_database = merge_databases(self.databases)
 
     @classmethod
     def from_disk(
@@ -77,7 +94,7 @@ class NickDatabase:
 
     def knows(self, nick: str) -> bool:
         """Return True if any of the databases contain the nick"""
-        return any(nick in database for database in self.databases)
+        return nick in self.merged_database
 
     def __contains__(self, nick: str) -> bool:
         """Implement `nick in nick_database` with `nick_database.knows(nick)`"""
@@ -85,9 +102,10 @@ class NickDatabase:
 
     def denick(self, nick: str) -> str:
         """Return True if any of the databases contain the nick"""
-        for database in self.databases:
-            if nick in database:
-                return database[nick]
+        # NOTE: Store a reference to the merged database in case it is replaced
+        merged_database = self.merged_database
+        if nick in merged_database:
+            return merged_database[nick]
 
         raise ValueError("{nick} is not known by the database")
 
@@ -96,17 +114,31 @@ class NickDatabase:
         return self.denick(nick)
 
     def get(self, nick: str) -> str | None:
-        """Aquire the lock and return the result if we have it. Otherwise None"""
-        with self.mutex:
-            if nick in self:
-                return self[nick]
-            else:
-                return None
+        """Return the result if we have it. Otherwise None"""
+        return self.merged_database.get(nick, None)
 
     def get_default(self, nick: str) -> str | None:
-        """Aquire the lock and return the result if we have it in the first database"""
+        """Return the result if we have it in the first database. Otherwise None"""
+        return self.default_database.get(nick, None)
+
+    def update_default_database(
+        self, *, removed: Iterable[str], added: Mapping[str, str]
+    ) -> None:
+        """Publish a copy of the default database with the given nicks updated"""
         with self.mutex:
-            return self.default_database.get(nick, None)
+            new_default_database = self.default_database.copy()
+
+            for nick in removed:
+                new_default_database.pop(nick, None)
+
+            new_default_database.update(added)
+
+            new_databases = [new_default_database, *self.databases[1:]]
+            new_merged_database = merge_databases(new_databases)
+
+            self.databases = new_databases
+            self.default_database = new_default_database
+            self.merged_database = new_merged_database
 
 
 # Empty nick database for use as default arg
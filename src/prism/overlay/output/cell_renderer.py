@@ -1,6 +1,7 @@
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, replace
 from functools import lru_cache
+from operator import attrgetter
 from typing import assert_never
 
 from prism.overlay.output.cells import CellValue, ColorSection, ColumnName
@@ -489,8 +490,24 @@ def render_stats(
     )
 
 
+@lru_cache(maxsize=10)
+def make_column_picker(
+    column_names: tuple[ColumnName, ...]
+) -> Callable[[RenderedStats], tuple[CellValue, ...]]:
+    """Make a function picking the listed property names from a RenderedStats"""
+    if not column_names:
+        return lambda rendered_stats: ()
+
+    if len(column_names) == 1:
+        # attrgetter with a single attribute does not return a tuple
+        get_column = attrgetter(column_names[0])
+        return lambda rendered_stats: (get_column(rendered_stats),)
+
+    return attrgetter(*column_names)
+
+
 def pick_columns(
     rendered_stats: RenderedStats, column_names: tuple[ColumnName, ...]
 ) -> tuple[CellValue, ...]:
     """Pick the listed property names from the RenderedStats instance"""
-    return tuple(getattr(rendered_stats, column_name) for column_name in column_names)
+    return make_column_picker(column_names)(rendered_stats)
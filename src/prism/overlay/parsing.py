@@ -1,6 +1,7 @@
 import logging
 import re
 from collections.abc import Sequence
+from functools import lru_cache
 from typing import Final
 
 from prism.overlay.events import (
@@ -100,6 +101,15 @@ def get_highest_index(source: str, *strings: str) -> str | None:
     return result
 
 
+# Every logline that parses to an event contains at least one of these
+EVENT_MARKERS = ("[CHAT] ", "Setting user: ")
+
+
+def may_contain_event(logline: str) -> bool:
+    """Cheap check to rule out loglines that can't parse to an event"""
+    return any(marker in logline for marker in EVENT_MARKERS)
+
+
 def parse_logline(logline: str) -> Event | None:
     """Parse a log line to detect players leaving or joining the lobby/party"""
 
@@ -195,6 +205,23 @@ def remove_deduplication_suffix(message: str) -> str:
 
 
 def parse_chat_message(message: str) -> ChatEvent | None:
+    """Log the chat message and parse it with the cached _parse_chat_message"""
+    # Use lazy printf-style formatting because these messages are very common
+    logger.debug("Chat message: '%s'", message)
+
+    event = _parse_chat_message(message)
+
+    logger.debug("Parsed chat message as %s", event)
+
+    return event
+
+
+# Chat messages like join/leave announcements and /who results repeat often
+# NOTE: Cached events are shared between all parses of the same message. The events
+#       are frozen and hold tuples, and callers must never mutate them.
+# NOTE: The step-by-step debug logging below only runs on a cache miss
+@lru_cache(maxsize=512)
+def _parse_chat_message(message: str) -> ChatEvent | None:
     """
     Parse a chat message to detect players leaving or joining the lobby/party
 
@@ -207,14 +234,11 @@ def parse_chat_message(message: str) -> ChatEvent | None:
     # Lobby changes
     WHO_PREFIX = "ONLINE: "
 
-    # Use lazy printf-style formatting because this message is very common
-    logger.debug("Chat message: '%s'", message)
-
     message = remove_deduplication_suffix(message)
 
     if message.startswith(WHO_PREFIX):
         # Info [CHAT] ONLINE: <username1>, <username2>, ..., <usernameN>
-        players = message.removeprefix(WHO_PREFIX).split(", ")
+        players = tuple(message.removeprefix(WHO_PREFIX).split(", "))
         return LobbyListEvent(players)
 
     if message.startswith("You are now nicked as "):
@@ -439,7 +463,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         names = remove_ranks(suffix)
 
         logger.debug(f"Parsing passed. Partying with {names}")
-        return PartyJoinEvent(names.split(", "))
+        return PartyJoinEvent(tuple(names.split(", ")))
 
     if " joined the party" in message:
         # Info [CHAT] [VIP+] <username> joined the party.
@@ -459,7 +483,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[0]
 
         logger.debug(f"Parsing passed. {username} joined the party")
-        return PartyJoinEvent([username])
+        return PartyJoinEvent((username,))
 
     if " has left the party" in message:
         # Info [CHAT] [VIP+] <username> has left the party.
@@ -479,7 +503,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[0]
 
         logger.debug(f"Parsing passed. {username} left the party")
-        return PartyLeaveEvent([username])
+        return PartyLeaveEvent((username,))
 
     if " has been removed from the party" in message:
         # Info [CHAT] [VIP+] <username> has been removed from the party.
@@ -499,7 +523,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[0]
 
         logger.debug(f"Parsing passed. {username} was kicked")
-        return PartyLeaveEvent([username])
+        return PartyLeaveEvent((username,))
 
     if (
         " was removed from the party because they disconnected" in message
@@ -523,7 +547,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[0]
 
         logger.debug(f"Parsing passed. {username} was kicked for disconnecting")
-        return PartyLeaveEvent([username])
+        return PartyLeaveEvent((username,))
 
     PARTY_KICK_OFFLINE_PREFIX = "Kicked "
     if (
@@ -542,7 +566,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         if not words_match(words[-4:], "because they were offline."):
             return None
 
-        usernames = " ".join(words[:-4]).split(", ")
+        usernames = tuple(" ".join(words[:-4]).split(", "))
 
         logger.debug(f"Parsing passed. {', '.join(usernames)} were kickoffline'd")
         return PartyLeaveEvent(usernames)
@@ -566,7 +590,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
         username = words[2]
 
         logger.debug(f"Parsing passed. {username} left")
-        return PartyLeaveEvent([username])
+        return PartyLeaveEvent((username,))
     """
     # noqa: W291
     Info [CHAT] -----------------------------
@@ -601,7 +625,7 @@ def parse_chat_message(message: str) -> ChatEvent | None:
                 .replace(" \uFFFD", "")  # ... turned into unicode replacement character
             )
 
-            players = clean_string.split(" ")
+            players = tuple(clean_string.split(" "))
 
             logger.debug(f"Parsing passed. Party {role=} are {players}")
             # I can't for the life of me get the literal types here
@@ -6,32 +6,35 @@ import win32gui  # type: ignore [import-untyped]
 logger = logging.getLogger(__name__)
 
 
+# Window styles for borderless fullscreen and regular maximized windows
+STYLE_BORDERLESS = (
+    win32con.WS_DLGFRAME
+    | win32con.WS_CLIPSIBLINGS
+    | win32con.WS_CLIPCHILDREN
+    | win32con.WS_VISIBLE
+)
+STYLE_NORMAL = (
+    win32con.WS_DLGFRAME
+    | win32con.WS_CLIPSIBLINGS
+    | win32con.WS_CLIPCHILDREN
+    | win32con.WS_VISIBLE
+    | win32con.WS_BORDER
+    | win32con.WS_DLGFRAME
+    | win32con.WS_SYSMENU
+    | win32con.WS_THICKFRAME
+    | win32con.WS_MINIMIZEBOX
+    | win32con.WS_MAXIMIZEBOX
+)
+
+
 def set_windowstate(hwnd: int, fullscreen: bool) -> None:
     """Set a window to be borderless fullscreen/regular maximized"""
-    style_BL = (
-        win32con.WS_DLGFRAME
-        | win32con.WS_CLIPSIBLINGS
-        | win32con.WS_CLIPCHILDREN
-        | win32con.WS_VISIBLE
-    )
-    style_Normal = (
-        win32con.WS_DLGFRAME
-        | win32con.WS_CLIPSIBLINGS
-        | win32con.WS_CLIPCHILDREN
-        | win32con.WS_VISIBLE
-        | win32con.WS_BORDER
-        | win32con.WS_DLGFRAME
-        | win32con.WS_SYSMENU
-        | win32con.WS_THICKFRAME
-        | win32con.WS_MINIMIZEBOX
-        | win32con.WS_MAXIMIZEBOX
-    )
     if fullscreen:
         win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
-        win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style_BL)
+        win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, STYLE_BORDERLESS)
         win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
     else:
-        win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style_Normal)
+        win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, STYLE_NORMAL)
         win32gui.MoveWindow(hwnd, 100, 100, 1000, 600, False)
         win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
 
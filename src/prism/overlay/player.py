@@ -1,8 +1,8 @@
-import functools
+import math
 import operator
-from collections.abc import Mapping, Set
+from collections.abc import Callable, Mapping, Set
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Literal, Self, TypedDict, TypeVar, assert_never
+from typing import TYPE_CHECKING, Literal, Self, TypedDict, TypeVar
 
 from prism.calc import bedwars_level_from_exp
 from prism.hypixel import MissingStatsError, get_gamemode_stats
@@ -66,24 +66,22 @@ class KnownPlayer:
     username: str
     uuid: str
     nick: str | None = field(default=None)
+    # List of known aliases for the player. Computed once in __post_init__
+    aliases: tuple[str, ...] = field(init=False, compare=False, repr=False)
+    # True if the player is missing winstreak stats. Computed once in __post_init__
+    is_missing_winstreaks: bool = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Set the .aliases and .is_missing_winstreaks fields"""
+        aliases = (self.username,) if self.nick is None else (self.username, self.nick)
+        # NOTE: The dataclass is frozen, so we have to bypass its __setattr__
+        object.__setattr__(self, "aliases", aliases)
+        object.__setattr__(self, "is_missing_winstreaks", self.stats.winstreak is None)
 
     @property
     def stats_unknown(self) -> bool:
         return False
 
-    @property
-    def is_missing_winstreaks(self) -> bool:
-        """Return True if the player is missing winstreak stats in any gamemode"""
-        return self.stats.winstreak is None
-
-    @property
-    def aliases(self) -> tuple[str, ...]:
-        """List of known aliases for the player"""
-        aliases = [self.username]
-        if self.nick is not None:
-            aliases.append(self.nick)
-        return tuple(aliases)
-
     def update_winstreaks(
         self,
         overall: int | None,
@@ -158,51 +156,41 @@ class UnknownPlayer:
 Player = KnownPlayer | NickedPlayer | PendingPlayer | UnknownPlayer
 
 
+# Functions to get the value of the stat to sort by for each column
+# NOTE: When column="username" we set stat=0 so that we instead rely on
+#       the fallback sorting by username to order the list.
+#       If we added the username here we would get reverse alphabetical
+STAT_GETTERS: dict["ColumnName", Callable[[KnownPlayer], int | float]] = {
+    "username": lambda player: 0,
+    "stars": operator.attrgetter("stars"),
+    "index": operator.attrgetter("stats.index"),
+    "fkdr": operator.attrgetter("stats.fkdr"),
+    "kdr": operator.attrgetter("stats.kdr"),
+    "bblr": operator.attrgetter("stats.bblr"),
+    "wlr": operator.attrgetter("stats.wlr"),
+    "kills": operator.attrgetter("stats.kills"),
+    "finals": operator.attrgetter("stats.finals"),
+    "beds": operator.attrgetter("stats.beds"),
+    "wins": operator.attrgetter("stats.wins"),
+    "winstreak": lambda player: (
+        player.stats.winstreak if player.stats.winstreak is not None else math.inf
+    ),
+}
+
+
 def rate_player(
     player: Player, party_members: Set[str], column: "ColumnName"
-) -> tuple[bool, bool, str | int | float]:
+) -> tuple[bool, bool, int | float]:
     """Used as a key function for sorting"""
     is_enemy = player.username not in party_members
 
     # The value of the stat to sort by
-    # NOTE: When column="username" we set stat=0 so that we instead rely on
-    #       the fallback sorting by username to order the list.
-    #       If we added the username here we would get reverse alphabetical
     stat: int | float
 
     if isinstance(player, KnownPlayer):
-        if column == "username":
-            stat = 0
-        elif column == "stars":
-            stat = player.stars
-        elif column == "index":
-            stat = player.stats.index
-        elif column == "fkdr":
-            stat = player.stats.fkdr
-        elif column == "kdr":
-            stat = player.stats.kdr
-        elif column == "bblr":
-            stat = player.stats.bblr
-        elif column == "wlr":
-            stat = player.stats.wlr
-        elif column == "kills":
-            stat = player.stats.kills
-        elif column == "finals":
-            stat = player.stats.finals
-        elif column == "beds":
-            stat = player.stats.beds
-        elif column == "wins":
-            stat = player.stats.wins
-        elif column == "winstreak":
-            stat = (
-                player.stats.winstreak
-                if player.stats.winstreak is not None
-                else float("inf")
-            )
-        else:  # pragma: no coverage
-            assert_never(column)
+        stat = STAT_GETTERS[column](player)
     else:
-        stat = 0 if column == "username" else float("-inf")
+        stat = 0 if column == "username" else -math.inf
 
     return (is_enemy, player.stats_unknown, stat)
 
@@ -216,15 +204,13 @@ def sort_players(
     Falls back to alpabetical by username.
     Orders party members last.
     """
-    return list(
-        sorted(
-            sorted(players, key=operator.attrgetter("username")),
-            key=functools.partial(
-                rate_player, party_members=party_members, column=column
-            ),
-            reverse=True,
-        )
-    )
+
+    def sort_key(player: Player) -> tuple[bool, bool, int | float, str]:
+        """Sort descending by the rating, then ascending by username"""
+        is_enemy, stats_unknown, stat = rate_player(player, party_members, column)
+        return (not is_enemy, not stats_unknown, -stat, player.username)
+
+    return sorted(players, key=sort_key)
 
 
 PlayerDataField = TypeVar("PlayerDataField")
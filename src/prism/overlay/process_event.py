@@ -1,6 +1,7 @@
 import logging
+from collections.abc import Callable, Iterable
 from dataclasses import replace
-from typing import Iterable
+from typing import Any
 
 from prism.overlay.behaviour import (
     autodenick_teammate,
@@ -8,232 +9,345 @@ from prism.overlay.behaviour import (
     set_nickname,
 )
 from prism.overlay.controller import OverlayController
-from prism.overlay.events import Event, EventType
-from prism.overlay.parsing import parse_logline
+from prism.overlay.events import (
+    BedwarsDisconnectEvent,
+    BedwarsFinalKillEvent,
+    BedwarsGameStartingSoonEvent,
+    BedwarsReconnectEvent,
+    EndBedwarsGameEvent,
+    Event,
+    EventType,
+    InitializeAsEvent,
+    LobbyJoinEvent,
+    LobbyLeaveEvent,
+    LobbyListEvent,
+    LobbySwapEvent,
+    NewNicknameEvent,
+    PartyAttachEvent,
+    PartyDetachEvent,
+    PartyJoinEvent,
+    PartyLeaveEvent,
+    PartyListIncomingEvent,
+    PartyMembershipListEvent,
+    StartBedwarsGameEvent,
+    WhisperCommandSetNickEvent,
+)
+from prism.overlay.parsing import may_contain_event, parse_logline
 from prism.overlay.state import OverlayState
 
 logger = logging.getLogger(__name__)
 
 
-def process_event(
-    controller: OverlayController, event: Event
+def process_initialize_as(
+    controller: OverlayController, state: OverlayState, event: InitializeAsEvent
 ) -> tuple[OverlayState, bool]:
-    """Return an updated OverlayState, and a boolean flag redraw"""
-    # Store a persistent view to the current state
-    state = controller.state
+    # Initializing means the player restarted/switched accounts -> clear the state
+    logger.info("Playing as %s. Cleared party and lobby.", event.username)
 
-    if event.event_type is EventType.INITIALIZE_AS:
-        # Initializing means the player restarted/switched accounts -> clear the state
-        logger.info(f"Playing as {event.username}. Cleared party and lobby.")
+    return OverlayState.fresh(event.username), True
 
-        new_state = replace(
-            state, own_username=event.username, in_queue=False, out_of_sync=False
-        )
-        return new_state.clear_party().clear_lobby(), True
-
-    if event.event_type is EventType.NEW_NICKNAME:
-        # User got a new nickname
-        logger.info(f"Setting new nickname {event.nick}={state.own_username}")
-        if state.own_username is None:
-            logger.warning(
-                "Own username is not set, could not add denick entry for {event.nick}."
-            )
-            return state, False
-
-        set_nickname(
-            username=state.own_username, nick=event.nick, controller=controller
+
+def process_new_nickname(
+    controller: OverlayController, state: OverlayState, event: NewNicknameEvent
+) -> tuple[OverlayState, bool]:
+    # User got a new nickname
+    logger.info("Setting new nickname %s=%s", event.nick, state.own_username)
+    if state.own_username is None:
+        logger.warning(
+            "Own username is not set, could not add denick entry for %s.", event.nick
         )
+        return state, False
+
+    set_nickname(username=state.own_username, nick=event.nick, controller=controller)
+
+    # set_nickname sets redraw_flag
+    return state, False
+
+
+def process_lobby_swap(
+    controller: OverlayController, state: OverlayState, event: LobbySwapEvent
+) -> tuple[OverlayState, bool]:
+    # Changed lobby -> clear the lobby
+    logger.info("Received lobby swap. Clearing the lobby")
 
-        # set_nickname sets redraw_flag
+    # Leaving the queue to a new lobby
+    # Reset the users preference for showing the overlay
+    controller.wants_shown = None
+
+    return state.clear_lobby().leave_queue(), True
+
+
+def process_lobby_list(
+    controller: OverlayController, state: OverlayState, event: LobbyListEvent
+) -> tuple[OverlayState, bool]:
+    # Results from /who -> override lobby_players
+    logger.info(
+        "Updating lobby players from who command: '%s'", ", ".join(event.usernames)
+    )
+
+    # Show the overlay when you type /who
+    # Set the preference if we are not in queue, otherwise just reset it, as
+    # showing the overlay in queue is the default
+    controller.wants_shown = True if not state.in_queue else None
+
+    # Doing /who while in game, we only get the alive players, so the lobby may
+    # still be out of sync. We ignore that here to avoid getting stuck with an
+    # out of sync warning for an entire game
+    # Also: We set the entire lobby, and not just the alive players here to avoid
+    # issues where you type /who at the start of a new queue, when the overlay
+    # hasn't realized you're not still in a game
+    return state.sync_lobby(event.usernames), True
+
+
+def process_lobby_join(
+    controller: OverlayController, state: OverlayState, event: LobbyJoinEvent
+) -> tuple[OverlayState, bool]:
+    if event.player_cap < 8:
+        logger.debug("Gamemode has too few players to be bedwars. Skipping.")
         return state, False
 
-    if event.event_type is EventType.LOBBY_SWAP:
-        # Changed lobby -> clear the lobby
-        logger.info("Received lobby swap. Clearing the lobby")
+    # NOTE: Joining the queue can clear the lobby, so do that first
+    queue_state = state.join_queue()
+
+    # Compute the new lobby, and apply all the changes in one go at the end
+    lobby_players = queue_state.lobby_players | {event.username}
+    alive_players = queue_state.alive_players | {event.username}
+
+    if event.player_count != len(lobby_players):
+        # We are out of sync with the lobby.
+        # This happens when you first join a lobby, as the previous lobby is
+        # never cleared. It could also be due to a bug.
+        logger.debug("Player count out of sync.")
+        out_of_sync = True
+
+        if event.player_count < len(lobby_players):
+            # We know of too many players, some must actually not be in the lobby
+            logger.debug("Too many players in lobby. Clearing.")
+            lobby_players = alive_players = frozenset({event.username})
+
+            # Clearing the lobby may have gotten us back in sync
+            out_of_sync = event.player_count != len(lobby_players)
+    else:
+        # We are in sync now
+        out_of_sync = False
+
+    logger.info(
+        "%s joined your lobby (%d/%d)",
+        event.username,
+        event.player_count,
+        event.player_cap,
+    )
+
+    if not state.in_queue:
+        # This is a new queue - reset the users preference for showing the overlay
+        controller.wants_shown = None
+
+    return (
+        replace(
+            queue_state,
+            lobby_players=lobby_players,
+            alive_players=alive_players,
+            out_of_sync=out_of_sync,
+        ),
+        True,
+    )
+
 
-        # Leaving the queue to a new lobby
-        # Reset the users preference for showing the overlay
+def process_lobby_leave(
+    controller: OverlayController, state: OverlayState, event: LobbyLeaveEvent
+) -> tuple[OverlayState, bool]:
+    # Someone left the lobby -> Remove them from the lobby
+    logger.info("%s left your lobby", event.username)
+
+    if not state.in_queue:
+        # This is a new queue - reset the users preference for showing the overlay
         controller.wants_shown = None
 
-        return state.clear_lobby().leave_queue(), True
+    return state.join_queue().remove_from_lobby(event.username), True
 
-    if event.event_type is EventType.LOBBY_LIST:
-        # Results from /who -> override lobby_players
-        logger.info(
-            f"Updating lobby players from who command: '{', '.join(event.usernames)}'"
-        )
 
-        # Show the overlay when you type /who
-        # Set the preference if we are not in queue, otherwise just reset it, as
-        # showing the overlay in queue is the default
-        controller.wants_shown = True if not state.in_queue else None
-
-        # Doing /who while in game, we only get the alive players, so the lobby may
-        # still be out of sync. We ignore that here to avoid getting stuck with an
-        # out of sync warning for an entire game
-        # Also: We set the entire lobby, and not just the alive players here to avoid
-        # issues where you type /who at the start of a new queue, when the overlay
-        # hasn't realized you're not still in a game
-        return state.set_out_of_sync(False).set_lobby(event.usernames), True
-
-    if event.event_type is EventType.LOBBY_JOIN:
-        if event.player_cap < 8:
-            logger.debug("Gamemode has too few players to be bedwars. Skipping.")
-            return state, False
-
-        new_state = state.join_queue().add_to_lobby(event.username)
-
-        if event.player_count != len(new_state.lobby_players):
-            # We are out of sync with the lobby.
-            # This happens when you first join a lobby, as the previous lobby is
-            # never cleared. It could also be due to a bug.
-            logger.debug("Player count out of sync.")
-            out_of_sync = True
-
-            if event.player_count < len(new_state.lobby_players):
-                # We know of too many players, some must actually not be in the lobby
-                logger.debug("Too many players in lobby. Clearing.")
-                new_state = new_state.clear_lobby().add_to_lobby(event.username)
-
-                # Clearing the lobby may have gotten us back in sync
-                out_of_sync = event.player_count != len(new_state.lobby_players)
-        else:
-            # We are in sync now
-            out_of_sync = False
-
-        logger.info(
-            f"{event.username} joined your lobby "
-            f"({event.player_count}/{event.player_cap})"
-        )
+def process_party_detach(
+    controller: OverlayController, state: OverlayState, event: PartyDetachEvent
+) -> tuple[OverlayState, bool]:
+    # Leaving the party -> remove all but yourself from the party
+    logger.info("Leaving the party, clearing all members")
+
+    return state.clear_party(), True
+
 
-        if not state.in_queue:
-            # This is a new queue - reset the users preference for showing the overlay
-            controller.wants_shown = None
+def process_party_attach(
+    controller: OverlayController, state: OverlayState, event: PartyAttachEvent
+) -> tuple[OverlayState, bool]:
+    # You joined a player's party -> add them to your party
+
+    logger.info("Joined %s's party", event.username)
 
-        return new_state.set_out_of_sync(out_of_sync), True
+    # Make sure the party is clean to start with
+    return state.clear_party().add_to_party(event.username), True
 
-    if event.event_type is EventType.LOBBY_LEAVE:
-        # Someone left the lobby -> Remove them from the lobby
-        logger.info(f"{event.username} left your lobby")
 
-        if not state.in_queue:
-            # This is a new queue - reset the users preference for showing the overlay
-            controller.wants_shown = None
+def process_party_join(
+    controller: OverlayController, state: OverlayState, event: PartyJoinEvent
+) -> tuple[OverlayState, bool]:
+    # Someone joined your party -> add them to your party
+    new_state = state.add_many_to_party(event.usernames)
+
+    logger.info("%s joined your party", ", ".join(event.usernames))
 
-        return state.join_queue().remove_from_lobby(event.username), True
+    return new_state, True
 
-    if event.event_type is EventType.PARTY_DETACH:
-        # Leaving the party -> remove all but yourself from the party
-        logger.info("Leaving the party, clearing all members")
 
+def process_party_leave(
+    controller: OverlayController, state: OverlayState, event: PartyLeaveEvent
+) -> tuple[OverlayState, bool]:
+    if state.own_username in event.usernames:
+        # You left the party -> clear the party instead
         return state.clear_party(), True
 
-    if event.event_type is EventType.PARTY_ATTACH:
-        # You joined a player's party -> add them to your party
+    # Someone left your party -> remove them from your party
+    new_state = state.remove_many_from_party(event.usernames)
 
-        logger.info(f"Joined {event.username}'s party")
+    logger.info("%s left your party", ", ".join(event.usernames))
 
-        # Make sure the party is clean to start with
-        return state.clear_party().add_to_party(event.username), True
+    return new_state, True
 
-    if event.event_type is EventType.PARTY_JOIN:
-        # Someone joined your party -> add them to your party
-        new_state = state
-        for username in event.usernames:
-            new_state = new_state.add_to_party(username)
 
-        logger.info(f"{' ,'.join(event.usernames)} joined your party")
+def process_party_list_incoming(
+    controller: OverlayController, state: OverlayState, event: PartyListIncomingEvent
+) -> tuple[OverlayState, bool]:
+    # This is a response from /pl (/party list)
+    # In the following lines we will get all the party members -> clear the party
 
-        return new_state, True
+    logger.debug(
+        "Receiving response from /pl -> clearing party and awaiting further data"
+    )
 
-    if event.event_type is EventType.PARTY_LEAVE:
-        if state.own_username in event.usernames:
-            # You left the party -> clear the party instead
-            return state.clear_party(), True
+    # No need to redraw as we're waiting for further input
+    return state.clear_party(), False
 
-        new_state = state
 
-        # Someone left your party -> remove them from your party
-        for username in event.usernames:
-            new_state = new_state.remove_from_party(username)
+def process_party_role_list(
+    controller: OverlayController, state: OverlayState, event: PartyMembershipListEvent
+) -> tuple[OverlayState, bool]:
+    logger.info("Adding party %s %s from /pl", event.role, ", ".join(event.usernames))
 
-        logger.info(f"{' ,'.join(event.usernames)} left your party")
+    return state.add_many_to_party(event.usernames), True
 
-        return new_state, True
 
-    if event.event_type is EventType.PARTY_LIST_INCOMING:
-        # This is a response from /pl (/party list)
-        # In the following lines we will get all the party members -> clear the party
+def process_bedwars_game_starting_soon(
+    controller: OverlayController,
+    state: OverlayState,
+    event: BedwarsGameStartingSoonEvent,
+) -> tuple[OverlayState, bool]:
+    # Bedwars game is starting soon
+    logger.info("Bedwars game starting soon %d second(s)", event.seconds)
+    return state, False
 
-        logger.debug(
-            "Receiving response from /pl -> clearing party and awaiting further data"
-        )
 
-        # No need to redraw as we're waiting for further input
-        return state.clear_party(), False
+def process_start_bedwars_game(
+    controller: OverlayController, state: OverlayState, event: StartBedwarsGameEvent
+) -> tuple[OverlayState, bool]:
+    # Bedwars game has started
+    logger.info("Bedwars game starting")
 
-    if event.event_type is EventType.PARTY_ROLE_LIST:
-        logger.info(f"Adding party {event.role} {', '.join(event.usernames)} from /pl")
+    # Try to denick a teammate right before we leave the queue (start the game)
+    if controller.settings.autodenick_teammates:
+        autodenick_teammate(controller)
 
-        new_state = state
-        for username in event.usernames:
-            new_state = new_state.add_to_party(username)
+    # Leaving the queue and starting a game
+    # Reset the users preference for showing the overlay
+    controller.wants_shown = None
 
-        return new_state, True
+    return state.leave_queue(), False
 
-    if event.event_type is EventType.BEDWARS_GAME_STARTING_SOON:
-        # Bedwars game is starting soon
-        logger.info(f"Bedwars game starting soon {event.seconds} second(s)")
-        return state, False
 
-    if event.event_type is EventType.START_BEDWARS_GAME:
-        # Bedwars game has started
-        logger.info("Bedwars game starting")
+def process_bedwars_final_kill(
+    controller: OverlayController, state: OverlayState, event: BedwarsFinalKillEvent
+) -> tuple[OverlayState, bool]:
+    # Bedwars final kill
+    logger.info("Final kill: %s - %s", event.dead_player, event.raw_message)
 
-        # Try to denick a teammate right before we leave the queue (start the game)
-        if controller.settings.autodenick_teammates:
-            autodenick_teammate(controller)
+    return state.mark_dead(event.dead_player), True
 
-        # Leaving the queue and starting a game
-        # Reset the users preference for showing the overlay
-        controller.wants_shown = None
 
-        return state.leave_queue(), False
+def process_bedwars_disconnect(
+    controller: OverlayController, state: OverlayState, event: BedwarsDisconnectEvent
+) -> tuple[OverlayState, bool]:
+    # Bedwars disconnect
+    logger.info("Player disconnected: %s", event.username)
+
+    return state.mark_dead(event.username), True
 
-    if event.event_type is EventType.BEDWARS_FINAL_KILL:
-        # Bedwars final kill
-        logger.info(f"Final kill: {event.dead_player} - {event.raw_message}")
 
-        return state.mark_dead(event.dead_player), True
+def process_bedwars_reconnect(
+    controller: OverlayController, state: OverlayState, event: BedwarsReconnectEvent
+) -> tuple[OverlayState, bool]:
+    # Bedwars reconnect
+    logger.info("Player reconnected: %s", event.username)
 
-    if event.event_type is EventType.BEDWARS_DISCONNECT:
-        # Bedwars disconnect
-        logger.info(f"Player disconnected: {event.username}")
+    return state.mark_alive(event.username), True
 
-        return state.mark_dead(event.username), True
 
-    if event.event_type is EventType.BEDWARS_RECONNECT:
-        # Bedwars reconnect
-        logger.info(f"Player reconnected: {event.username}")
+def process_end_bedwars_game(
+    controller: OverlayController, state: OverlayState, event: EndBedwarsGameEvent
+) -> tuple[OverlayState, bool]:
+    # Bedwars game has ended
+    logger.info("Bedwars game ended")
+    bedwars_game_ended(controller)
 
-        return state.mark_alive(event.username), True
+    return state.clear_lobby(), True
 
-    if event.event_type is EventType.END_BEDWARS_GAME:
-        # Bedwars game has ended
-        logger.info("Bedwars game ended")
-        bedwars_game_ended(controller)
 
-        return state.clear_lobby(), True
+def process_whisper_command_set_nick(
+    controller: OverlayController,
+    state: OverlayState,
+    event: WhisperCommandSetNickEvent,
+) -> tuple[OverlayState, bool]:
+    # User set a nick with /w !nick=username
+    logger.info("Setting nick from whisper command %s=%s", event.nick, event.username)
+
+    # NOTE: Make sure not to deadlock
+    set_nickname(username=event.username, nick=event.nick, controller=controller)
+
+    # set_nickname sets redraw_flag
+    return state, False
+
+
+# Functions processing each type of event, keyed by event type
+EVENT_PROCESSORS: dict[
+    EventType,
+    Callable[[OverlayController, OverlayState, Any], tuple[OverlayState, bool]],
+] = {
+    EventType.INITIALIZE_AS: process_initialize_as,
+    EventType.NEW_NICKNAME: process_new_nickname,
+    EventType.LOBBY_SWAP: process_lobby_swap,
+    EventType.LOBBY_LIST: process_lobby_list,
+    EventType.LOBBY_JOIN: process_lobby_join,
+    EventType.LOBBY_LEAVE: process_lobby_leave,
+    EventType.PARTY_DETACH: process_party_detach,
+    EventType.PARTY_ATTACH: process_party_attach,
+    EventType.PARTY_JOIN: process_party_join,
+    EventType.PARTY_LEAVE: process_party_leave,
+    EventType.PARTY_LIST_INCOMING: process_party_list_incoming,
+    EventType.PARTY_ROLE_LIST: process_party_role_list,
+    EventType.BEDWARS_GAME_STARTING_SOON: process_bedwars_game_starting_soon,
+    EventType.START_BEDWARS_GAME: process_start_bedwars_game,
+    EventType.BEDWARS_FINAL_KILL: process_bedwars_final_kill,
+    EventType.BEDWARS_DISCONNECT: process_bedwars_disconnect,
+    EventType.BEDWARS_RECONNECT: process_bedwars_reconnect,
+    EventType.END_BEDWARS_GAME: process_end_bedwars_game,
+    EventType.WHISPER_COMMAND_SET_NICK: process_whisper_command_set_nick,
+}
 
-    if event.event_type is EventType.WHISPER_COMMAND_SET_NICK:
-        # User set a nick with /w !nick=username
-        logger.info(f"Setting nick from whisper command {event.nick}={event.username}")
 
-        # NOTE: Make sure not to deadlock
-        set_nickname(username=event.username, nick=event.nick, controller=controller)
+def process_event(
+    controller: OverlayController, event: Event
+) -> tuple[OverlayState, bool]:
+    """Return an updated OverlayState, and a boolean flag redraw"""
+    # Store a persistent view to the current state
+    state = controller.state
 
-        # set_nickname sets redraw_flag
-        return state, False
+    return EVENT_PROCESSORS[event.event_type](controller, state, event)
 
 
 def fast_forward_state(controller: OverlayController, loglines: Iterable[str]) -> None:
@@ -244,12 +358,16 @@ def fast_forward_state(controller: OverlayController, loglines: Iterable[str]) -
     """
     logger.info("Fast forwarding state")
     for line in loglines:
+        # Most of the historical log is irrelevant -> skip it without parsing
+        if not may_contain_event(line):
+            continue
+
         event = parse_logline(line)
 
         if event is None:
             continue
 
-        controller.state, redraw = process_event(controller, event)
+        controller.state, _ = process_event(controller, event)
     logger.info("Done fast forwarding state")
 
 
@@ -260,6 +378,10 @@ def process_loglines(loglines: Iterable[str], controller: OverlayController) ->
     NOTE: Caller must ensure exclusive write-access to controller.state
     """
     for line in loglines:
+        # Skip the bulk of the loglines without parsing them
+        if not may_contain_event(line):
+            continue
+
         event = parse_logline(line)
 
         if event is None:
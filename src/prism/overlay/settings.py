@@ -1,5 +1,7 @@
 import logging
+import os
 import threading
+import tomllib
 from collections.abc import Callable, Mapping, MutableMapping
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -178,9 +180,15 @@ class Settings:
         self.alpha_hundredths = new_settings["alpha_hundredths"]
 
     def flush_to_disk(self) -> None:
+        # Write to a temporary file and move it into place so that a crash mid-write
+        # can't leave us with a truncated settings file
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+
         # toml.load(path) uses encoding='utf-8'
-        with self.path.open("w", encoding="utf-8") as f:
+        with tmp_path.open("w", encoding="utf-8") as f:
             toml.dump(self.to_dict(), f)
+
+        os.replace(tmp_path, self.path)
         logger.info(f"Wrote settings to disk: {self}")
 
 
@@ -199,7 +207,9 @@ def api_key_is_valid(key: str) -> bool:
 
 
 def read_settings(path: Path) -> MutableMapping[str, object]:
-    return toml.load(path)
+    # NOTE: tomllib parses faster than toml, which we still use for writing
+    with path.open("rb") as f:
+        return tomllib.load(f)
 
 
 def get_boolean_setting(
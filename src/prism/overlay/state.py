@@ -21,6 +21,11 @@ class OverlayState:
     in_queue: bool = False
     own_username: str | None = None
 
+    @classmethod
+    def fresh(cls, own_username: str) -> Self:
+        """Create a new state for the given user with only yourself in the party"""
+        return cls(party_members=frozenset({own_username}), own_username=own_username)
+
     def join_queue(self) -> Self:
         """
         Join a queue by setting in_queue = True
@@ -59,15 +64,27 @@ class OverlayState:
         """Add the given username to the party"""
         return replace(self, party_members=self.party_members | {username})
 
+    def add_many_to_party(self, usernames: Iterable[str]) -> Self:
+        """Add all the given usernames to the party"""
+        return replace(self, party_members=self.party_members.union(usernames))
+
     def remove_from_party(self, username: str) -> Self:
         """Remove the given username from the party"""
-        if username not in self.party_members:
+        return self.remove_many_from_party((username,))
+
+    def remove_many_from_party(self, usernames: Iterable[str]) -> Self:
+        """Remove all the given usernames from the party"""
+        removed_usernames = frozenset(usernames)
+
+        for username in removed_usernames - self.party_members:
             logger.warning(
                 f"Tried removing {username} from the party, but they were not in it!"
             )
+
+        if self.party_members.isdisjoint(removed_usernames):
             return self
 
-        return replace(self, party_members=self.party_members - {username})
+        return replace(self, party_members=self.party_members - removed_usernames)
 
     def clear_party(self) -> Self:
         """Remove all players from the party, except for yourself"""
@@ -115,6 +132,16 @@ class OverlayState:
         new_lobby_set = frozenset(new_lobby)
         return replace(self, lobby_players=new_lobby_set, alive_players=new_lobby_set)
 
+    def sync_lobby(self, new_lobby: Iterable[str]) -> Self:
+        """Set the lobby to be the given complete lobby, and mark us as in sync"""
+        new_lobby_set = frozenset(new_lobby)
+        return replace(
+            self,
+            lobby_players=new_lobby_set,
+            alive_players=new_lobby_set,
+            out_of_sync=False,
+        )
+
     def clear_lobby(self) -> Self:
         """Remove all players from the lobby"""
         # Don't include yourself in the new lobby.
@@ -4,6 +4,7 @@ import queue
 import sys
 import threading
 import time
+from collections import deque
 from collections.abc import Callable, Iterable
 from functools import cache
 
@@ -68,7 +69,7 @@ class GetStatsThread(threading.Thread):  # pragma: nocover
     def __init__(
         self,
         requests_queue: queue.Queue[str],
-        completed_queue: queue.Queue[str],
+        completed_queue: deque[str],
         controller: OverlayController,
     ) -> None:
         super().__init__(daemon=True)  # Don't block the process from exiting
@@ -165,7 +166,8 @@ def prepare_overlay(
     # Usernames we want the stats of
     requested_stats_queue = queue.Queue[str]()
     # Usernames we have newly downloaded the stats of
-    completed_stats_queue = queue.Queue[str]()
+    # deque.append and deque.popleft are thread-safe, and we never wait on this queue
+    completed_stats_queue = deque[str]()
 
     # Spawn thread for updating state
     UpdateStateThread(controller=controller, loglines=loglines).start()
@@ -1,6 +1,7 @@
 import logging
 import platform
 import time
+import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Self
@@ -282,7 +283,8 @@ def read_logfile_cache(logfile_cache_path: Path) -> tuple[LogfileCache, bool]:
     logfile_cache_updated = False
 
     try:
-        logfile_cache = toml.load(logfile_cache_path)
+        with logfile_cache_path.open("rb") as f:
+            logfile_cache = tomllib.load(f)
     except Exception:
         logger.exception("failed loading logfile cache")
         logfile_cache = {}
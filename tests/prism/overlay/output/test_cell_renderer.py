@@ -505,6 +505,8 @@ RENDERED_STATS = RenderedStats(
 
 
 PICK_COLUMNS_CASES: tuple[tuple[tuple[ColumnName, ...], tuple[CellValue, ...]], ...] = (
+    ((), ()),
+    (("username",), (USERNAME_VALUE,)),
     (("username", "stars"), (USERNAME_VALUE, STARS_VALUE)),
     (
         ("username", "stars", "fkdr", "wlr", "winstreak"),
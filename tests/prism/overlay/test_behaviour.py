@@ -1,5 +1,5 @@
-import queue
 import unittest.mock
+from collections import deque
 from collections.abc import Mapping
 from dataclasses import dataclass, replace
 from typing import cast
@@ -37,7 +37,10 @@ def set_known_nicks(known_nicks: dict[str, str], controller: OverlayController)
     """Update the settings and nickdatabase with the uuid->nick mapping"""
     for uuid, nick in known_nicks.items():
         controller.settings.known_nicks[nick] = {"uuid": uuid, "comment": ""}
-        controller.nick_database.default_database[nick] = uuid
+
+    controller.nick_database.update_default_database(
+        removed=(), added={nick: uuid for uuid, nick in known_nicks.items()}
+    )
 
 
 KNOWN_NICKS: tuple[dict[str, str], ...] = (
@@ -157,11 +160,10 @@ def test_should_redraw(
     if redraw_event_set:
         controller.redraw_event.set()
 
-    completed_stats_queue = queue.Queue[str]()
-    for username in completed_stats:
-        completed_stats_queue.put_nowait(username)
+    completed_stats_queue = deque[str](completed_stats)
 
     assert should_redraw(controller, completed_stats_queue) == result
+    assert not completed_stats_queue
 
 
 @pytest.mark.parametrize("winstreak_api_enabled", (True, False))
@@ -208,7 +210,7 @@ def test_get_and_cache_stats(
         else (MISSING_WINSTREAKS, False)
     )
 
-    completed_queue = queue.Queue[str]()
+    completed_queue = deque[str]()
 
     # For typing
     assert user.nick is not None
@@ -216,14 +218,14 @@ def test_get_and_cache_stats(
     get_stats_and_winstreak(user.nick, completed_queue, controller)
 
     # One update for getting the stats
-    assert completed_queue.get_nowait() == user.nick
+    assert completed_queue.popleft() == user.nick
 
     # One update for getting estimated winstreaks
     if not winstreak_api_enabled and estimated_winstreaks:
-        assert completed_queue.get_nowait() == user.nick
+        assert completed_queue.popleft() == user.nick
     else:
-        with pytest.raises(queue.Empty):
-            completed_queue.get_nowait()
+        with pytest.raises(IndexError):
+            completed_queue.popleft()
 
 
 def test_update_settings_nothing() -> None:
@@ -236,8 +238,10 @@ def test_update_settings_nothing() -> None:
 
     update_settings(settings_before.to_dict(), controller)
 
-    # We store the settings every time, even if no changes occurred.
-    assert controller.settings == controller._stored_settings == settings_before
+    # Nothing changed, so we don't store the settings or redraw
+    assert controller.settings == settings_before
+    assert controller._stored_settings is None
+    assert not controller.redraw_event.is_set()
 
 
 def test_update_settings_known_nicks() -> None:
@@ -330,7 +334,7 @@ def test_update_settings_everything_changed() -> None:
 
     update_settings(new_settings, controller)
 
-    # We store the settings every time, even if no changes occurred.
+    # The new settings are stored
     assert (
         controller.settings
         == controller._stored_settings
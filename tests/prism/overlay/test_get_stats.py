@@ -76,11 +76,13 @@ def test_denick() -> None:
     assert denick(NICK, controller) is None
 
     # Hit in database
-    controller.nick_database.databases.append({NICK: "database-uuid"})
+    controller.nick_database = NickDatabase([{}, {NICK: "database-uuid"}])
     assert denick(NICK, controller) == "database-uuid"
 
     # Hit in default database
-    controller.nick_database.default_database[NICK] = "default-database-uuid"
+    controller.nick_database.update_default_database(
+        removed=(), added={NICK: "default-database-uuid"}
+    )
     assert denick(NICK, controller) == "default-database-uuid"
 
 
@@ -32,27 +32,50 @@ def test_nick_database() -> None:
     with pytest.raises(ValueError):
         nick_database[nick]
 
-    with nick_database.mutex:
-        databases[1][nick] = "someuuid"
-        assert nick in nick_database
-        assert nick_database.knows(nick)
+    nick_database = NickDatabase([{}, {nick: "someuuid"}, {}])
+    assert nick in nick_database
+    assert nick_database.knows(nick)
 
-        assert nick_database[nick] == "someuuid"
-        assert nick_database.denick(nick) == "someuuid"
+    assert nick_database[nick] == "someuuid"
+    assert nick_database.denick(nick) == "someuuid"
     assert nick_database.get(nick) == "someuuid"
     assert nick_database.get_default(nick) is None
 
-    with nick_database.mutex:
-        databases[0][nick] = "higherprionick"
-        assert nick in nick_database
-        assert nick_database.knows(nick)
+    nick_database.update_default_database(removed=(), added={nick: "higherprionick"})
+    assert nick in nick_database
+    assert nick_database.knows(nick)
 
-        assert nick_database[nick] == "higherprionick"
-        assert nick_database.denick(nick) == "higherprionick"
+    assert nick_database[nick] == "higherprionick"
+    assert nick_database.denick(nick) == "higherprionick"
     assert nick_database.get(nick) == "higherprionick"
     assert nick_database.get_default(nick) == "higherprionick"
 
 
+def test_update_default_database() -> None:
+    """Assert that updates publish a new default database"""
+    default_database = {"OldNick": "olduuid", "KeptNick": "kepteduuid"}
+    secondary_database = {"OldNick": "secondaryuuid"}
+    nick_database = NickDatabase([default_database, secondary_database])
+
+    nick_database.update_default_database(
+        removed=("OldNick",), added={"NewNick": "newuuid"}
+    )
+
+    # The published databases are not mutated
+    assert default_database == {"OldNick": "olduuid", "KeptNick": "kepteduuid"}
+
+    assert nick_database.default_database == {
+        "KeptNick": "kepteduuid",
+        "NewNick": "newuuid",
+    }
+    assert nick_database.databases[0] is nick_database.default_database
+    assert nick_database.databases[1] is secondary_database
+
+    assert nick_database.get("NewNick") == "newuuid"
+    assert nick_database.get("OldNick") == "secondaryuuid"
+    assert nick_database.get_default("OldNick") is None
+
+
 @pytest.mark.parametrize(
     "json_data, obj, exception",
     (
@@ -31,6 +31,7 @@ from prism.overlay.parsing import (
     CLIENT_INFO_PREFIXES,
     get_highest_index,
     get_lowest_index,
+    may_contain_event,
     parse_chat_message,
     parse_logline,
     remove_deduplication_suffix,
@@ -387,7 +388,7 @@ parsing_test_cases: tuple[tuple[str, Event | None], ...] = (
     (
         "[Info: 2021-11-29 22:30:40.455294561: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] ONLINE: Player1, Player2, Player3, Player5, Player6, Player7, Player8, Player9",
         LobbyListEvent(
-            usernames=[
+            usernames=(
                 "Player1",
                 "Player2",
                 "Player3",
@@ -396,7 +397,7 @@ parsing_test_cases: tuple[tuple[str, Event | None], ...] = (
                 "Player7",
                 "Player8",
                 "Player9",
-            ]
+            )
         ),
     ),
     (
@@ -417,13 +418,13 @@ parsing_test_cases: tuple[tuple[str, Event | None], ...] = (
     (
         # Lobby list on lunar client
         "[15:03:53] [Client thread/INFO]: [CHAT] ONLINE: Player1",
-        LobbyListEvent(usernames=["Player1"]),
+        LobbyListEvent(usernames=("Player1",)),
     ),
     *(
         (
             # Lobby list on lunar client (deduplicated chat message ([x2])
             f"[23:09:10] [Client thread/INFO]: [CHAT] ONLINE: Player1, Player2 [x{count}]",
-            LobbyListEvent(usernames=["Player1", "Player2"]),
+            LobbyListEvent(usernames=("Player1", "Player2")),
         )
         for count in range(2, 15)
     ),
@@ -488,39 +489,39 @@ parsing_test_cases: tuple[tuple[str, Event | None], ...] = (
     ),
     (
         "[Info: 2021-12-06 20:38:05.407568857: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] You'll be partying with: Player2, [MVP++] Player3, [MVP+] Player4, [MVP+] Player5",
-        PartyJoinEvent(usernames=["Player2", "Player3", "Player4", "Player5"]),
+        PartyJoinEvent(usernames=("Player2", "Player3", "Player4", "Player5")),
     ),
     (
         "[Info: 2021-11-29 20:08:53.706306034: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] [MVP+] Player2 joined the party.",
-        PartyJoinEvent(usernames=["Player2"]),
+        PartyJoinEvent(usernames=("Player2",)),
     ),
     (
         "[Info: 2021-11-29 22:16:47.779503684: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] [VIP] Player1 has left the party.",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-11-29 22:28:52.033936996: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] The party was transferred to Player2 because [MVP++] Player1 left",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-12-09 00:21:25.792896760: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] [VIP+] Player1 has been removed from the party.",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-12-09 00:21:30.953440842: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Kicked [VIP] Player1 because they were offline.",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-12-09 00:21:30.953440842: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] [MVP+] Player1 was removed from the party because they disconnected",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-12-10 00:57:30.104719428: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Kicked [MVP++] Player1, [MVP+] Player2 because they were offline.",
-        PartyLeaveEvent(usernames=["Player1", "Player2"]),
+        PartyLeaveEvent(usernames=("Player1", "Player2")),
     ),
     (
         "[22:23:15] [Client thread/INFO]: [CHAT] [MVP++] Player1 was removed from your party because they disconnected.",
-        PartyLeaveEvent(usernames=["Player1"]),
+        PartyLeaveEvent(usernames=("Player1",)),
     ),
     (
         "[Info: 2021-11-29 22:17:40.417692543: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Party Members (3)",
@@ -528,28 +529,28 @@ parsing_test_cases: tuple[tuple[str, Event | None], ...] = (
     ),
     (
         "[Info: 2021-11-29 22:17:40.417791980: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Party Leader: [MVP++] Player1 ●",
-        PartyMembershipListEvent(usernames=["Player1"], role="leader"),
+        PartyMembershipListEvent(usernames=("Player1",), role="leader"),
     ),
     (
         "[Info: 2021-11-29 22:17:40.417869567: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Party Moderators: Player2 ● [MVP+] Player3 ● ",
-        PartyMembershipListEvent(usernames=["Player2", "Player3"], role="moderators"),
+        PartyMembershipListEvent(usernames=("Player2", "Player3"), role="moderators"),
     ),
     (
         "[Info: 2021-11-29 22:17:40.417869567: GameCallbacks.cpp(162)] Game/net.minecraft.client.gui.GuiNewChat (Client thread) Info [CHAT] Party Members: Player2 ● [MVP+] Player3 ● ",
-        PartyMembershipListEvent(usernames=["Player2", "Player3"], role="members"),
+        PartyMembershipListEvent(usernames=("Player2", "Player3"), role="members"),
     ),
     (
         # Decoding error on windows due to reading win-encoded file as utf8 makes the
         # orb turn into a question mark
         # Note: This is just on encode - so it is probably not what we read
         "[22:47:04] [Client thread/INFO]: [CHAT] Party Leader: [MVP+] Player1 ?",
-        PartyMembershipListEvent(usernames=["Player1"], role="leader"),
+        PartyMembershipListEvent(usernames=("Player1",), role="leader"),
     ),
     (
         # Decoding error on windows due to reading win-encoded file as utf8 makes the
         # orb turn into a the unicode replacement character
         "[22:47:04] [Client thread/INFO]: [CHAT] Party Leader: [MVP+] Player1 \uFFFD",
-        PartyMembershipListEvent(usernames=["Player1"], role="leader"),
+        PartyMembershipListEvent(usernames=("Player1",), role="leader"),
     ),
     (
         "[18:47:15] [Client thread/INFO]: [CHAT] The game starts in 20 seconds!",
@@ -675,3 +676,29 @@ parsing_test_ids = [make_test_id(test_case) for test_case in parsing_test_cases]
 def test_parsing(logline: str, event: Event) -> None:
     """Assert that the correct events are returned from parse_logline"""
     assert parse_logline(logline) == event
+
+
+@pytest.mark.parametrize("logline, event", parsing_test_cases, ids=parsing_test_ids)
+def test_may_contain_event(logline: str, event: Event | None) -> None:
+    """Assert that no loglines with events are ruled out"""
+    if event is not None:
+        assert may_contain_event(logline)
+
+
+@pytest.mark.parametrize(
+    "logline, result",
+    (
+        ("", False),
+        ("[Client thread/INFO]: Loaded 12 advancements", False),
+        ("[Client thread/INFO]: [CHAT] Hello", True),
+        ("(Client thread) Info Setting user: Player", True),
+    ),
+)
+def test_may_contain_event_result(logline: str, result: bool) -> None:
+    assert may_contain_event(logline) is result
+
+
+def test_parse_chat_message_cached() -> None:
+    """Assert that repeated chat messages reuse the parsed event"""
+    message = "ONLINE: Player1, Player2"
+    assert parse_chat_message(message) is parse_chat_message(message)
@@ -1,10 +1,12 @@
 from collections.abc import Mapping
+from dataclasses import replace
 
 import pytest
 
 from prism.calc import bedwars_level_from_exp
-from prism.overlay.output.cells import ColumnName
+from prism.overlay.output.cells import ALL_COLUMN_NAMES, ColumnName
 from prism.overlay.player import (
+    STAT_GETTERS,
     KnownPlayer,
     Player,
     Stats,
@@ -477,6 +479,11 @@ def test_sort_stats(
     assert sort_players(players, party_members, column) == result
 
 
+def test_stat_getters_complete() -> None:
+    """Assert that we can sort by every column"""
+    assert STAT_GETTERS.keys() == ALL_COLUMN_NAMES
+
+
 @pytest.mark.parametrize(
     "player, is_missing_winstreaks",
     (
@@ -491,6 +498,21 @@ def test_is_missing_winstreaks(
     assert player.is_missing_winstreaks == is_missing_winstreaks
 
 
+def test_is_missing_winstreaks_updated() -> None:
+    player = make_player()
+    assert player.is_missing_winstreaks
+
+    updated_player = player.update_winstreaks(
+        overall=10,
+        solo=None,
+        doubles=None,
+        threes=None,
+        fours=None,
+        winstreaks_accurate=True,
+    )
+    assert not updated_player.is_missing_winstreaks
+
+
 @pytest.mark.parametrize(
     "player, aliases",
     (
@@ -508,6 +530,11 @@ def test_aliases(player: Player, aliases: tuple[str, ...]) -> None:
     assert player.aliases == aliases
 
 
+def test_aliases_updated_on_replace() -> None:
+    player = make_player(variant="player", username="player1")
+    assert replace(player, nick="AmazingNick").aliases == ("player1", "AmazingNick")
+
+
 def test_create_known_player(technoblade_playerdata: Mapping[str, object]) -> None:
     fkdr = 20124 / 260
     stars = bedwars_level_from_exp(1076936)
@@ -1,9 +1,11 @@
 import unittest.mock
-from collections.abc import Iterable
-from typing import Final
+from collections.abc import Callable, Iterable
+from dataclasses import fields
+from typing import Any, Final, get_type_hints
 
 import pytest
 
+from prism.overlay.controller import OverlayController
 from prism.overlay.events import (
     BedwarsDisconnectEvent,
     BedwarsFinalKillEvent,
@@ -11,6 +13,7 @@ from prism.overlay.events import (
     BedwarsReconnectEvent,
     EndBedwarsGameEvent,
     Event,
+    EventType,
     InitializeAsEvent,
     LobbyJoinEvent,
     LobbyLeaveEvent,
@@ -27,10 +30,12 @@ from prism.overlay.events import (
     WhisperCommandSetNickEvent,
 )
 from prism.overlay.process_event import (
+    EVENT_PROCESSORS,
     fast_forward_state,
     process_event,
     process_loglines,
 )
+from prism.overlay.state import OverlayState
 from tests.prism.overlay.utils import OWN_USERNAME, MockedController, create_state
 
 process_event_test_cases_base: tuple[
@@ -108,7 +113,7 @@ process_event_test_cases_base: tuple[
         MockedController(
             state=create_state(lobby_players={"PersonFromLastLobby"}, in_queue=False)
         ),
-        LobbyListEvent([OWN_USERNAME, "Player1", "Player2"]),
+        LobbyListEvent((OWN_USERNAME, "Player1", "Player2")),
         MockedController(
             state=create_state(
                 lobby_players={OWN_USERNAME, "Player1", "Player2"}, in_queue=False
@@ -123,7 +128,7 @@ process_event_test_cases_base: tuple[
             state=create_state(lobby_players={"PersonFromLastLobby"}, in_queue=True),
             wants_shown=False,
         ),  # Old members cleared
-        LobbyListEvent([OWN_USERNAME, "Player1", "Player2"]),
+        LobbyListEvent((OWN_USERNAME, "Player1", "Player2")),
         MockedController(
             state=create_state(
                 lobby_players={OWN_USERNAME, "Player1", "Player2"}, in_queue=True
@@ -148,7 +153,7 @@ process_event_test_cases_base: tuple[
     (
         "party join multiple",
         MockedController(state=create_state(party_members={"OwnUsername", "Player2"})),
-        PartyJoinEvent(["Player3", "Player4"]),
+        PartyJoinEvent(("Player3", "Player4")),
         MockedController(
             state=create_state(
                 party_members={"OwnUsername", "Player2", "Player3", "Player4"}
@@ -161,7 +166,7 @@ process_event_test_cases_base: tuple[
         MockedController(
             state=create_state(party_members={"OwnUsername", "Player2", "Player3"})
         ),
-        PartyLeaveEvent(["Player3"]),
+        PartyLeaveEvent(("Player3",)),
         MockedController(state=create_state(party_members={"OwnUsername", "Player2"})),
         True,
     ),
@@ -170,7 +175,7 @@ process_event_test_cases_base: tuple[
         MockedController(
             state=create_state(party_members={"OwnUsername", "Player2", "Player3"})
         ),
-        PartyLeaveEvent(["Player3", "Player2"]),
+        PartyLeaveEvent(("Player3", "Player2")),
         MockedController(state=create_state(party_members={"OwnUsername"})),
         True,
     ),
@@ -186,7 +191,7 @@ process_event_test_cases_base: tuple[
     (
         "party list moderators",
         MockedController(state=create_state(party_members={"OwnUsername"})),
-        PartyMembershipListEvent(usernames=["Player1", "Player2"], role="moderators"),
+        PartyMembershipListEvent(usernames=("Player1", "Player2"), role="moderators"),
         MockedController(
             state=create_state(party_members={"Player1", "Player2", "OwnUsername"})
         ),
@@ -409,7 +414,7 @@ process_event_test_cases_base: tuple[
         # Player not in party leaves party
         "player not in party leaves party",
         MockedController(state=create_state(party_members={"OwnUsername", "Player2"})),
-        PartyLeaveEvent(["RandomPlayer"]),
+        PartyLeaveEvent(("RandomPlayer",)),
         MockedController(state=create_state(party_members={"OwnUsername", "Player2"})),
         # TODO: False,
         True,
@@ -543,7 +548,7 @@ process_event_test_cases_base: tuple[
     (
         "don't remove yourself from the party",
         MockedController(state=create_state()),
-        PartyLeaveEvent(["OwnUsername"]),
+        PartyLeaveEvent(("OwnUsername",)),
         MockedController(state=create_state()),
         True,
     ),
@@ -552,14 +557,14 @@ process_event_test_cases_base: tuple[
         MockedController(
             state=create_state(party_members={"OwnUsername", "abc", "def"})
         ),
-        PartyLeaveEvent(["OwnUsername"]),
+        PartyLeaveEvent(("OwnUsername",)),
         MockedController(state=create_state()),
         True,
     ),
     (
         "party leave with no own_username",
         MockedController(state=create_state(own_username=None)),
-        PartyLeaveEvent(["OwnUsername"]),
+        PartyLeaveEvent(("OwnUsername",)),
         MockedController(state=create_state(own_username=None)),
         True,
     ),
@@ -595,6 +600,23 @@ def test_process_event(
     assert will_redraw == redraw
 
 
+@pytest.mark.parametrize("event_type, processor", EVENT_PROCESSORS.items())
+def test_event_processors(
+    event_type: EventType,
+    processor: Callable[[OverlayController, OverlayState, Any], object],
+) -> None:
+    """Assert that every event type is processed by the matching function"""
+    event_class = get_type_hints(processor)["event"]
+    (event_type_field,) = (
+        field for field in fields(event_class) if field.name == "event_type"
+    )
+    assert event_type_field.default is event_type
+
+
+def test_event_processors_complete() -> None:
+    assert EVENT_PROCESSORS.keys() == set(EventType)
+
+
 @pytest.mark.parametrize(
     "event",
     (
@@ -1093,6 +1115,10 @@ def test_fast_forward_state(
             (f"{CHAT}[MVP+] Player1: hows ur day?",),
             MockedController(redraw_event_set=False),
         ),
+        (
+            ("[Client thread/INFO]: Loaded 12 advancements",),
+            MockedController(redraw_event_set=False),
+        ),
         (
             (f"{CHAT}Player1 has joined (1/16)!",),
             MockedController(
@@ -271,6 +271,9 @@ def test_read_and_write_settings(
     settings.path = tmp_path / "settings.toml"
     settings.flush_to_disk()
 
+    # The temporary file is moved into place
+    assert list(tmp_path.iterdir()) == [settings.path]
+
     # NOTE: We can no longer do this since we store some null values in the dictionary
     #       which just get stored as missing keys in the toml
     # read_settings_dict = read_settings(settings.path)
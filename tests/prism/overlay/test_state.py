@@ -21,3 +21,57 @@ from tests.prism.overlay.utils import create_state
 )
 def test_clear_party(before: OverlayState, after: OverlayState) -> None:
     assert before.clear_party() == after
+
+
+def test_add_to_lobby() -> None:
+    state = create_state(lobby_players={"Player1"}, alive_players=set())
+    assert state.add_to_lobby("Player2") == create_state(
+        lobby_players={"Player1", "Player2"}, alive_players={"Player2"}
+    )
+
+
+@pytest.mark.parametrize("before", (False, True))
+@pytest.mark.parametrize("after", (False, True))
+def test_set_out_of_sync(before: bool, after: bool) -> None:
+    assert create_state(out_of_sync=before).set_out_of_sync(after) == create_state(
+        out_of_sync=after
+    )
+
+
+@pytest.mark.parametrize(
+    "username, after",
+    (
+        ("Player2", create_state()),
+        ("NotInParty", create_state(party_members={"OwnUsername", "Player2"})),
+    ),
+)
+def test_remove_from_party(username: str, after: OverlayState) -> None:
+    state = create_state(party_members={"OwnUsername", "Player2"})
+    assert state.remove_from_party(username) == after
+
+
+def test_many_party_members() -> None:
+    state = create_state()
+
+    state = state.add_many_to_party(["Player2", "Player3", "Player4"])
+    assert state == create_state(
+        party_members={"OwnUsername", "Player2", "Player3", "Player4"}
+    )
+
+    state = state.remove_many_from_party(["Player2", "Player3", "NotInParty"])
+    assert state == create_state(party_members={"OwnUsername", "Player4"})
+
+
+def test_sync_lobby() -> None:
+    state = create_state(
+        lobby_players={"Player1", "Player2"},
+        alive_players={"Player1"},
+        out_of_sync=True,
+    )
+    assert state.sync_lobby(["Player2", "Player3"]) == create_state(
+        lobby_players={"Player2", "Player3"}, out_of_sync=False
+    )
+
+
+def test_fresh() -> None:
+    assert OverlayState.fresh("OwnUsername") == create_state()
@@ -1,6 +1,9 @@
+import unittest.mock
+
 import pytest
+from cachetools import TTLCache
 
-from prism.mojang import compare_uuids
+from prism.mojang import compare_uuids, get_uuid
 
 
 @pytest.mark.parametrize(
@@ -33,3 +36,22 @@ from prism.mojang import compare_uuids
 )
 def test_compare_uuids(uuid_1: str, uuid_2: str, equal: bool) -> None:
     assert compare_uuids(uuid_1, uuid_2) is equal
+
+
+@pytest.mark.parametrize("uuid", ("4cea508d954d42618f074b7494ca1d02", None))
+def test_get_uuid_cached(uuid: str | None) -> None:
+    """Assert that both found and missing uuids are cached"""
+    with unittest.mock.patch.dict(
+        "prism.mojang.LOWERCASE_UUID_CACHE", clear=True
+    ), unittest.mock.patch(
+        "prism.mojang.LOWERCASE_MISSING_UUID_CACHE", TTLCache(maxsize=512, ttl=60)
+    ), unittest.mock.patch(
+        "prism.mojang._request_uuid", return_value=uuid
+    ) as request_uuid:
+        assert get_uuid("SomeUser") == uuid
+        request_uuid.assert_called_once()
+
+        # Later lookups are served from the cache, regardless of casing
+        assert get_uuid("SomeUser") == uuid
+        assert get_uuid("someuser") == uuid
+        request_uuid.assert_called_once()
@@ -1,7 +1,7 @@
-import math
-import unittest.mock
+import time
+from collections import deque
 from collections.abc import Callable
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -9,6 +9,14 @@ from prism.ratelimiting import RateLimiter
 from tests.mock_utils import MockedTime, _MockedTimeModule
 
 
+@pytest.fixture
+def mocked_time(monkeypatch: pytest.MonkeyPatch) -> _MockedTimeModule:
+    """Patch the time module used by the ratelimiter, starting at t=0"""
+    mocked_time_module = MockedTime().time
+    monkeypatch.setattr("prism.ratelimiting.time", mocked_time_module)
+    return mocked_time_module
+
+
 @pytest.mark.parametrize(
     "limit, window",
     (
@@ -29,19 +37,25 @@ def time_ratelimiter(
     window: float,
     limit: int,
     make_requests: Callable[[RateLimiter, _MockedTimeModule], list[float]],
+    mocked_time_module: _MockedTimeModule,
 ) -> None:
-    """Assert that RateLimiter appropriately limits requests"""
+    """
+    Assert that RateLimiter appropriately limits requests
+
+    make_requests must return the request timestamps in chronological order
+    """
     # Init the ratelimiter at time t=0
-    with unittest.mock.patch(
-        "prism.ratelimiting.time", MockedTime().time
-    ) as mocked_time_module:
-        limiter = RateLimiter(limit=limit, window=window)
-        requests = sorted(make_requests(limiter, mocked_time_module))
+    limiter = RateLimiter(limit=limit, window=window)
+    requests = make_requests(limiter, mocked_time_module)
+
+    assert all(
+        request <= next_request for request, next_request in zip(requests, requests[1:])
+    ), f"Requests are not in chronological order {requests}"
 
     time_elapsed = requests[-1] - requests[0]
 
     # Guaranteed minimal amount of windows for the given amount of requests
-    min_windows = math.ceil(len(requests) / limit) - 1
+    min_windows = (len(requests) + limit - 1) // limit - 1
     min_time = min_windows * window
 
     # Correctness of the ratelimiter
@@ -53,7 +67,7 @@ def time_ratelimiter(
     ), f"Requests are too close in time {requests}"
 
 
-def test_ratelimiting_sequential() -> None:
+def test_ratelimiting_sequential(mocked_time: _MockedTimeModule) -> None:
     """Assert that RateLimiter functions under sequential operation"""
     window = 1
     limit = 10
@@ -63,15 +77,16 @@ def test_ratelimiting_sequential() -> None:
         limiter: RateLimiter, mocked_time_module: _MockedTimeModule
     ) -> list[float]:
         requests: list[float] = []
+        append, monotonic = requests.append, mocked_time_module.monotonic
         for i in range(amt_requests):
             with limiter:
-                requests.append(mocked_time_module.monotonic())
+                append(monotonic())
         return requests
 
-    time_ratelimiter(window, limit, make_requests)
+    time_ratelimiter(window, limit, make_requests, mocked_time)
 
 
-def test_ratelimiting_parallell() -> None:
+def test_ratelimiting_parallell(mocked_time: _MockedTimeModule) -> None:
     """Assert that RateLimiter functions under parallell operation"""
     window = 1
     limit = 10
@@ -87,179 +102,130 @@ def test_ratelimiting_parallell() -> None:
         limiter: RateLimiter, mocked_time_module: _MockedTimeModule
     ) -> list[float]:
         requests: list[float] = []
+        append, monotonic = requests.append, mocked_time_module.monotonic
         for i in range(amt_iterations):
             with limiter:
-                requests.append(mocked_time_module.monotonic())
+                append(monotonic())
                 for i in range(amt_threads - 1):
                     with limiter:
-                        requests.append(mocked_time_module.monotonic())
+                        append(monotonic())
         return requests
 
-    time_ratelimiter(window, limit, make_requests)
+    time_ratelimiter(window, limit, make_requests, mocked_time)
 
 
-def test_ratelimiting_multithreaded() -> None:
+def test_ratelimiting_multithreaded(mocked_time: _MockedTimeModule) -> None:
     """Assert that RateLimiter functions under multithreaded operation"""
-    import queue
-    import threading
-    import time
-
     window = 1
     limit = 10
-    amt_iterations = 10
-    amt_threads = 32
-
-    class PerformOperationThread(threading.Thread):
-        def __init__(
-            self,
-            limiter: RateLimiter,
-            mocked_time_module: _MockedTimeModule,
-            requests_queue: queue.Queue[float],
-            iterations: int,
-        ) -> None:
-            super().__init__()
-            self.limiter = limiter
-            self.mocked_time_module = mocked_time_module
-            self.requests_queue = requests_queue
-            self.iterations = iterations
-
-        def run(self) -> None:
-            for i in range(self.iterations):
-                with self.limiter:
-                    self.requests_queue.put_nowait(self.mocked_time_module.monotonic())
-                    # Use real time.sleep to suspend execution in this thread
-                    time.sleep(0.1 / (self.iterations * amt_threads))
+    amt_iterations = 20
+    amt_threads = 16
+
+    assert amt_threads > limit, "Tests contention on a saturated limiter"
 
     def make_requests(
         limiter: RateLimiter, mocked_time_module: _MockedTimeModule
     ) -> list[float]:
-        requests_queue = queue.Queue[float]()
-        requests: list[float] = []
-        threads = [
-            PerformOperationThread(
-                limiter, mocked_time_module, requests_queue, amt_iterations
-            )
-            for i in range(amt_threads)
-        ]
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
-
-        while True:
-            try:
-                request = requests_queue.get_nowait()
-            except queue.Empty:
-                break
-            else:
-                requests_queue.task_done()
-                requests.append(request)
-
-        requests_queue.join()
+        # NOTE: deque.append is thread safe, and we only read after joining
+        requests = deque[float]()
 
-        return requests
+        append, monotonic = requests.append, mocked_time_module.monotonic
+
+        def perform_operations(thread_index: int) -> None:
+            for i in range(amt_iterations):
+                with limiter:
+                    append(monotonic())
+                    # Use real time.sleep to suspend execution in this thread
+                    time.sleep(0.1 / (amt_iterations * amt_threads))
+
+        with ThreadPoolExecutor(max_workers=amt_threads) as executor:
+            # Consume the results to re-raise any exceptions from the workers
+            list(executor.map(perform_operations, range(amt_threads)))
 
-    time_ratelimiter(window, limit, make_requests)
+        # The threads may append out of order, as the clock is mocked per thread
+        return sorted(requests)
 
+    time_ratelimiter(window, limit, make_requests, mocked_time)
 
-def test_ratelimiting_is_unblocked() -> None:
+
+def test_ratelimiting_is_unblocked(mocked_time: _MockedTimeModule) -> None:
     # This test is old, and now only checks that the ratelimiter is unblocked
     # To test that it is blocked and its block duration we have to interleave
     # the assertion with the call to __enter__ as the new implementation will
     # calculate how long a call to __enter__ has left to wait.
-    with unittest.mock.patch(
-        "prism.ratelimiting.time", MockedTime().time
-    ) as mocked_time_module:
-        limit = 2
-        window = 10
-        limiter = RateLimiter(limit=limit, window=window)
-        assert not limiter.is_blocked, "Not blocked to start with"
-        assert limiter.block_duration_seconds == 0
-
-        limiter.__enter__()
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-        mocked_time_module.sleep(5)
-        assert mocked_time_module.monotonic() == 5
-
-        limiter.__enter__()
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-        mocked_time_module.sleep(5)
-        assert mocked_time_module.monotonic() == 10
-
-        limiter.__exit__(None, None, None)
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-        mocked_time_module.sleep(5)
-        assert mocked_time_module.monotonic() == 15
-
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-        mocked_time_module.sleep(5)
-        assert mocked_time_module.monotonic() == 20
-
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-        mocked_time_module.sleep(5)
-        assert mocked_time_module.monotonic() == 25
-        limiter.__exit__(None, None, None)
-        assert not limiter.is_blocked
-        assert limiter.block_duration_seconds == 0
-
-
-def test_ratelimiting_is_blocked() -> None:
-    def _make_assertions_sleep(
-        limiter: RateLimiter,
-        mocked_time_module: _MockedTimeModule,
-        block_duration_seconds: float,
-    ) -> Callable[[float], None]:
-        true_sleep = mocked_time_module.sleep
-
-        def do_assertions_sleep(duration: float) -> None:
-            assert limiter.block_duration_seconds == block_duration_seconds
-            assert limiter.is_blocked is (block_duration_seconds > 0)
-            true_sleep(duration)
-
-        return do_assertions_sleep
-
-    with unittest.mock.patch(
-        "prism.ratelimiting.time", MockedTime().time
-    ) as mocked_time_module:
-        limit = 2
-        window = 10
-        limiter = RateLimiter(limit=limit, window=window)
-        make_assertions_sleep: Callable[[float], Callable[[float], None]] = partial(
-            _make_assertions_sleep, limiter, mocked_time_module
-        )
-
-        limiter.__enter__()
-        limiter.__enter__()
-        assert not limiter.is_blocked
-        assert mocked_time_module.monotonic() == 0
-
-        limiter.__exit__(None, None, None)
-        mocked_time_module.sleep(2)
-        limiter.__exit__(None, None, None)
-
-        with unittest.mock.patch.object(
-            mocked_time_module,
-            "sleep",
-            make_assertions_sleep(block_duration_seconds=8),  # type: ignore
-        ):
-            limiter.__enter__()
-
-        assert mocked_time_module.monotonic() == 10
-
-        with unittest.mock.patch.object(
-            mocked_time_module,
-            "sleep",
-            make_assertions_sleep(block_duration_seconds=2),  # type: ignore
-        ):
-            limiter.__enter__()
-
-        assert mocked_time_module.monotonic() == 12
-
-        mocked_time_module.sleep(11)
-        assert limiter.block_duration_seconds == 0
+    limit = 2
+    window = 10
+    limiter = RateLimiter(limit=limit, window=window)
+    assert not limiter.is_blocked, "Not blocked to start with"
+    assert limiter.block_duration_seconds == 0
+
+    limiter.__enter__()
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+    mocked_time.sleep(5)
+    assert mocked_time.monotonic() == 5
+
+    limiter.__enter__()
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+    mocked_time.sleep(5)
+    assert mocked_time.monotonic() == 10
+
+    limiter.__exit__(None, None, None)
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+    mocked_time.sleep(5)
+    assert mocked_time.monotonic() == 15
+
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+    mocked_time.sleep(5)
+    assert mocked_time.monotonic() == 20
+
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+    mocked_time.sleep(5)
+    assert mocked_time.monotonic() == 25
+    limiter.__exit__(None, None, None)
+    assert not limiter.is_blocked
+    assert limiter.block_duration_seconds == 0
+
+
+def test_ratelimiting_is_blocked(
+    mocked_time: _MockedTimeModule, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    limit = 2
+    window = 10
+    limiter = RateLimiter(limit=limit, window=window)
+
+    # The block durations the limiter should report when it goes to sleep, in order
+    expected_block_durations = [8, 2]
+    true_sleep = mocked_time.sleep
+
+    def assertions_sleep(duration: float) -> None:
+        block_duration_seconds = expected_block_durations.pop(0)
+        assert limiter.block_duration_seconds == block_duration_seconds
+        assert limiter.is_blocked is (block_duration_seconds > 0)
+        true_sleep(duration)
+
+    monkeypatch.setattr(mocked_time, "sleep", assertions_sleep)
+
+    limiter.__enter__()
+    limiter.__enter__()
+    assert not limiter.is_blocked
+    assert mocked_time.monotonic() == 0
+
+    limiter.__exit__(None, None, None)
+    true_sleep(2)
+    limiter.__exit__(None, None, None)
+
+    limiter.__enter__()
+    assert mocked_time.monotonic() == 10
+
+    limiter.__enter__()
+    assert mocked_time.monotonic() == 12
+
+    assert not expected_block_durations, "The limiter should have slept twice"
+
+    true_sleep(11)
+    assert limiter.block_duration_seconds == 0